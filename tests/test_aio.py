@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for aio sub-module in `treeio` package."""
+
+import asyncio
+import bz2
+import gzip
+import lzma
+import os
+import tempfile
+import unittest
+
+from treeio import aio
+from treeio import newick
+
+
+class MemoryStream:
+    """In-memory stand-in of `asyncio.StreamReader`."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+
+    async def read(self, n=-1):
+        await asyncio.sleep(0)
+        n = len(self.data) if n < 0 else n
+        chunk = self.data[self.pos : self.pos + n]
+        self.pos += len(chunk)
+        return chunk
+
+
+async def _collect(source, **kwargs):
+    return [newick.write_newick(t) async for t in aio.aread(source, **kwargs)]
+
+
+class TestAsyncIO(unittest.TestCase):
+    def test_aread_stream(self):
+        with open("./data/animals.nex", "rb") as file_nex:
+            data = file_nex.read()
+        # tiny chunks cut through statements, labels and comments
+        trees = asyncio.run(_collect(MemoryStream(data), chunk_size=7))
+        with open("./data/animals.nwk") as file_nwk:
+            tree = newick.read_newick(file_nwk.read())
+        self.assertEqual(len(trees), 3)
+        self.assertEqual(trees[0], newick.write_newick(tree))
+        # chunks shorter than the `#NEXUS` header
+        trees = asyncio.run(_collect(MemoryStream(data), chunk_size=3))
+        self.assertEqual(len(trees), 3)
+
+    def test_aread_compressed_stream(self):
+        with open("./data/animals.nex", "rb") as file_nex:
+            data = file_nex.read()
+        for compress in [gzip.compress, bz2.compress, lzma.compress]:
+            stream = MemoryStream(compress(data))
+            trees = asyncio.run(_collect(stream, chunk_size=4))
+            self.assertEqual(len(trees), 3)
+        # concatenated gzip members
+        stream = MemoryStream(
+            gzip.compress(data[:100]) + gzip.compress(data[100:])
+        )
+        self.assertEqual(len(asyncio.run(_collect(stream))), 3)
+
+    def test_aread_beast(self):
+        trees = asyncio.run(_collect("./data/animals.trees", chunk_size=50))
+        self.assertEqual(len(trees), 2)
+
+    def test_aread_burnin_thin(self):
+        stream = MemoryStream("(a,b);\n(c,d);\n(e,f);\n(g,h);\n".encode())
+        trees = asyncio.run(
+            _collect(stream, burnin=1, thin=2, chunk_size=5, max_pending=1)
+        )
+        self.assertEqual(trees, ["(c,d);", "(g,h);"])
+
+    def test_aread_backpressure(self):
+        stream = MemoryStream("".join(["(a,b);"] * 100).encode())
+
+        async def _first():
+            reader = aio.aread(stream, chunk_size=6, max_pending=2)
+            tree = await reader.__anext__()
+            await reader.aclose()
+            return tree
+
+        tree = asyncio.run(_first())
+        self.assertEqual(newick.write_newick(tree), "(a,b);")
+        # the 64-character head for sniffing, then `max_pending` trees
+        self.assertLess(stream.pos, 64 + 6 * 4)
+
+    def test_aread_json_path(self):
+        trees = asyncio.run(_collect("./data/animals.json"))
+        self.assertEqual(len(trees), 1)
+
+    def test_aread_compressed_path(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, "animals.trees.gz")
+            asyncio.run(aio.aconvert("./data/animals.nex", output_path))
+            trees = asyncio.run(_collect(output_path, chunk_size=16))
+        self.assertEqual(len(trees), 3)
+
+    def test_aconvert(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, "animals.nwk")
+            asyncio.run(aio.aconvert("./data/animals.nex", output_path))
+            with open(output_path) as file_nwk:
+                self.assertEqual(len(file_nwk.read().splitlines()), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
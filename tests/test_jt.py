@@ -3,9 +3,10 @@
 
 """Tests for `treeio` package."""
 
+import io
 import unittest
 
-from treeio import Tree
+from treeio import LabelTable, Tree
 from treeio import jt
 
 
@@ -16,6 +17,46 @@ class TestJsonIO(unittest.TestCase):
             for tree in trees:
                 self.assertIsInstance(tree, Tree)
 
+    def test_read_json_labels(self):
+        labels = LabelTable()
+        with open("./data/animals.json") as file_json:
+            json_string = file_json.read()
+        tree_a = jt.read_json(json_string, labels=labels)[0]
+        tree_b = jt.read_json(json_string, labels=labels)[0]
+        self.assertEqual(len(labels), 8)
+        self.assertEqual(tree_a.taxa(), frozenset(range(8)))
+        self.assertIs(tree_a.children[-1].name, tree_b.children[-1].name)
+        tree = jt.read_json(
+            '{"name": "R", "children": [{"name": "dog", "children": []}]}',
+            labels=labels,
+        )[0]
+        self.assertEqual(
+            tree.children[0].taxon_id, tree_a.children[-1].taxon_id
+        )
+
+    def test_write_json_trees(self):
+        trees = [Tree("Alpha"), Tree("Beta")]
+        json_string = jt.write_json(trees)
+        self.assertEqual(
+            [t.name for t in jt.read_json(json_string)], ["Alpha", "Beta"]
+        )
+        self.assertEqual(jt.write_json([]), "[]")
+        self.assertEqual(jt.write_json(t for t in trees), json_string)
+
+    def test_dump_json_streaming(self):
+        handle = io.StringIO()
+        written = []
+
+        def _trees():
+            for name in ["Alpha", "Beta", "Gamma"]:
+                # the previous trees are written before the next is made
+                written.append(handle.getvalue().count('"name"'))
+                yield Tree(name)
+
+        jt.dump_json(_trees(), handle)
+        self.assertEqual(written, [0, 0, 2])
+        self.assertEqual(len(jt.read_json(handle.getvalue())), 3)
+
     def test_write_json(self):
         node_a = Tree("Alpha")
         node_b = Tree("Beta")
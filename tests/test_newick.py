@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for newick sub-module in `treeio` package."""
+
+import io
+import unittest
+
+from treeio import LabelTable, Tree
+from treeio import newick
+
+
+class TestNewickIO(unittest.TestCase):
+    def test_read_newick(self):
+        with open("./data/animals.nwk") as file_nwk:
+            tree = newick.read_newick(file_nwk.read())
+        self.assertIsInstance(tree, Tree)
+        leaves = [node.name for node in tree if node.is_leaf()]
+        self.assertEqual(len(leaves), 8)
+        self.assertEqual(leaves[-1], "dog")
+        self.assertEqual(tree.children[-1].dist, 25.46154)
+
+    def test_read_quoted_and_support(self):
+        tree = newick.read_newick("(('a b':1,'it''s':2)0.95:3,c[&x=1]);")
+        clade = tree.children[0]
+        self.assertEqual(clade.supp, 0.95)
+        self.assertEqual(clade.dist, 3)
+        self.assertEqual([c.name for c in clade.children], ["a b", "it's"])
+
+    def test_read_invalid(self):
+        with self.assertRaises(ValueError):
+            newick.read_newick("((a,b);")
+        with self.assertRaises(ValueError):
+            newick.read_newick("(a,b));")
+        # a second label or branch length on one node
+        for nwk_string in ["(a b,c);", "(a:1:2,b);", "(a,b)x y;", "(a:1 b);"]:
+            with self.assertRaises(ValueError):
+                newick.read_newick(nwk_string)
+
+    def test_write_newick(self):
+        nwk_string = "((raccoon:19.2,bear:6.8)0.9:0.846,'sea lion':3.9);"
+        tree = newick.read_newick(nwk_string)
+        self.assertEqual(newick.write_newick(tree), nwk_string)
+
+    def test_iter_newick(self):
+        handle = io.StringIO("(a,b);\n(c,d);\n(e,'f;');\n(g,h);\n")
+        trees = newick.iter_newick(handle, burnin=1, thin=2)
+        self.assertEqual(
+            [newick.write_newick(t) for t in trees], ["(c,d);", "(g,h);"]
+        )
+
+    def test_invalid_sampling(self):
+        for kwargs in [{"thin": 0}, {"burnin": -1}]:
+            with self.assertRaises(ValueError):
+                newick.iter_newick(io.StringIO("(a,b);"), **kwargs)
+
+    def test_shared_labels(self):
+        labels = LabelTable()
+        tree_a = newick.read_newick("(raccoon,bear);", labels=labels)
+        tree_b = newick.read_newick("(bear,raccoon);", labels=labels)
+        self.assertIs(tree_a.children[0].name, tree_b.children[1].name)
+        self.assertEqual(tree_b.children[1].taxon_id, 0)
+        self.assertEqual(len(labels), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for nexus sub-module in `treeio` package."""
+
+import unittest
+
+from treeio import newick
+from treeio import nexus
+
+
+class TestNexusIO(unittest.TestCase):
+    def test_read_nexus(self):
+        with open("./data/animals.nex") as file_nex:
+            trees = list(nexus.iter_nexus(file_nex))
+        self.assertEqual(len(trees), 3)
+        with open("./data/animals.nwk") as file_nwk:
+            tree = newick.read_newick(file_nwk.read())
+        self.assertEqual(
+            newick.write_newick(trees[0]), newick.write_newick(tree)
+        )
+        # tip labels come from the same translate table
+        self.assertIs(trees[0].children[-1].name, trees[1].children[-1].name)
+
+    def test_read_beast(self):
+        with open("./data/animals.trees") as file_nex:
+            trees = list(nexus.iter_nexus(file_nex))
+        with open("./data/animals.nex") as file_nex:
+            expected = nexus.read_nexus(file_nex.read())
+        self.assertEqual(
+            [newick.write_newick(t) for t in trees],
+            [newick.write_newick(t) for t in expected[:2]],
+        )
+
+    def test_burnin_thin(self):
+        with open("./data/animals.nex") as file_nex:
+            trees = nexus.read_nexus(file_nex.read(), burnin=1, thin=2)
+        self.assertEqual(len(trees), 1)
+        self.assertEqual(trees[0].children[0].dist, 0.846)
+
+    def test_write_nexus(self):
+        with open("./data/animals.nex") as file_nex:
+            trees = nexus.read_nexus(file_nex.read())
+        nexus_string = nexus.write_nexus(trees)
+        self.assertIn("        8 dog\n", nexus_string)
+        self.assertEqual(
+            [newick.write_newick(t) for t in nexus.read_nexus(nexus_string)],
+            [newick.write_newick(t) for t in trees],
+        )
+
+    def test_write_nexus_new_taxa(self):
+        trees = [newick.read_newick(s) for s in ["(A,B);", "(A,'1');"]]
+        nexus_string = nexus.write_nexus(trees)
+        self.assertEqual(nexus_string.count("begin trees;"), 2)
+        self.assertEqual(
+            [newick.write_newick(t) for t in nexus.read_nexus(nexus_string)],
+            ["(A,B);", "(A,1);"],
+        )
+        self.assertEqual(nexus.read_nexus(nexus.write_nexus([])), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
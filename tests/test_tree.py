@@ -5,8 +5,11 @@
 
 import unittest
 
+import treeio.tree
 from treeio import show
-from treeio import Tree
+from treeio import jt
+from treeio import newick
+from treeio import LabelTable, Tree
 
 
 class TestTreeClass(unittest.TestCase):
@@ -29,6 +32,127 @@ class TestTreeClass(unittest.TestCase):
             "       └ Gamma ",
         )
 
+    def test_taxa(self):
+        labels = LabelTable()
+        tree_a = newick.read_newick("((A,B),(C,D));", labels=labels)
+        tree_b = newick.read_newick("((D,C),(B,A));", labels=labels)
+        self.assertEqual(tree_a.taxa(), frozenset(range(4)))
+        self.assertEqual(tree_a.taxa(), tree_b.taxa())
+        self.assertEqual(
+            [leaf.name for leaf in tree_b.leaves()], ["D", "C", "B", "A"]
+        )
+        self.assertEqual(tree_a.children[0].taxa(), tree_b.children[1].taxa())
+        self.assertEqual(Tree("X").taxa(), frozenset(["X"]))
+        # without a table, leaves have no id and compare by name
+        self.assertIsNone(newick.read_newick("(A,B);").children[0].taxon_id)
+        self.assertNotEqual(
+            newick.read_newick("(A,B);").taxa(),
+            newick.read_newick("(C,D);").taxa(),
+        )
+        json_string = (
+            '{"name": "R", "children": [{"name": "B"}, {"name": "A"}]}'
+        )
+        self.assertEqual(
+            newick.read_newick("(A,B);").taxa(),
+            jt.read_json(json_string)[0].taxa(),
+        )
+
+    def test_reparent(self):
+        node_a, node_b, node_c = Tree("Alpha"), Tree("Beta"), Tree("Gamma")
+        node_c.parent = node_a
+        node_c.parent = node_b
+        self.assertEqual(node_a.children, [])
+        self.assertEqual(node_b.children, [node_c])
+        node_a.children = [node_c]
+        self.assertEqual(node_b.children, [])
+        node_a.remove_child(node_c)
+        self.assertTrue(node_c.is_root())
+        with self.assertRaises(ValueError):
+            node_a.remove_child(node_c)
+        node_c.parent = node_b
+        node_c.parent = None
+        self.assertEqual(node_b.children, [])
+
+    def test_validate(self):
+        node_a = Tree("Alpha")
+        node_b = Tree("Beta", parent=node_a, dist=1)
+        node_c = Tree("Gamma", parent=node_b, supp=0.9)
+        self.assertIs(node_a.validate(), node_a)
+        self.assertIs(node_c.root(), node_a)
+        # shared node
+        node_a._children.append(node_c)
+        with self.assertRaises(ValueError):
+            node_a.validate()
+        node_a._children.pop()
+        # cycle
+        node_c._children.append(node_a)
+        node_a._parent = node_c
+        with self.assertRaises(ValueError):
+            node_a.validate()
+        with self.assertRaises(ValueError):
+            node_a.root()
+        node_c._children.pop()
+        node_a._parent = None
+        for value in [float("nan"), float("inf"), "1.0", True]:
+            node_b.dist = value
+            with self.assertRaises(ValueError):
+                node_a.validate()
+
+    def test_parent_cycle(self):
+        node_a, node_b = Tree("Alpha"), Tree("Beta")
+        node_c = Tree("Gamma", parent=node_b)
+        node_b.parent = node_a
+        Tree.set_debug(True)
+        try:
+            for node in [node_a, node_b]:
+                with self.assertRaises(ValueError):
+                    node.parent = node_c
+            with self.assertRaises(ValueError):
+                node_a.parent = node_a
+        finally:
+            Tree.set_debug(False)
+        self.assertIs(node_a.validate(), node_a)
+        self.assertTrue(node_a.is_root())
+        # no check outside debug mode, `validate` finds the cycle
+        node_a.parent = node_c
+        with self.assertRaises(ValueError):
+            node_a.validate()
+
+    def test_debug(self):
+        node_a, node_b = Tree("Alpha"), Tree("Beta")
+        node_b.parent = node_a
+        Tree.set_debug(True)
+        try:
+            node_c = Tree("Gamma", parent=node_b)
+            with self.assertRaises(ValueError):
+                node_c.children = iter([node_a])
+            with self.assertRaises(ValueError):
+                node_c.append_child(node_b)
+            with self.assertRaises(ValueError):
+                node_b.extend_children([node_b])
+            with self.assertRaises(ValueError):
+                node_c.append_child(tree=node_a)
+            node_d = Tree("Delta")
+            node_c.extend_children(tree=iter([node_d]))
+            self.assertIs(node_d.parent, node_c)
+            node_c.remove_child(tree=node_d)
+            # rejected before the change, so the tree is still valid
+            self.assertIs(node_a.validate(), node_a)
+            self.assertEqual(node_c.children, [])
+            with self.assertRaises(ValueError):
+                node_b.dist = float("nan")
+            with self.assertRaises(ValueError):
+                Tree("Delta", supp="0.9")
+            node_b.dist = 1.5
+            self.assertEqual(node_b.dist, 1.5)
+        finally:
+            Tree.set_debug(False)
+        self.assertNotIn("parent", treeio.tree._ORIGINALS)
+        self.assertNotIn("dist", Tree.__dict__)
+        self.assertEqual(node_b.dist, 1.5)
+        node_b.dist = float("nan")
+        node_b.append_child(Tree("Delta"))
+
 
 if __name__ == "__main__":
     unittest.main()
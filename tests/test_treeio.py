@@ -4,10 +4,16 @@
 """Tests for `treeio` package."""
 
 
+import os
+import tempfile
 import unittest
 from click.testing import CliRunner
 
 from treeio import cli
+from treeio import jt
+from treeio import newick
+from treeio.treeio import convert_format
+from treeio.utils import guess_compression, open_file
 
 
 class TestCommandLine(unittest.TestCase):
@@ -19,6 +25,70 @@ class TestCommandLine(unittest.TestCase):
         help_result = runner.invoke(cli.cli, ["--help"])
         self.assertEqual(help_result.exit_code, 0)
 
+    def test_convert_nexus(self):
+        """Test converting nexus into newick."""
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, "animals.nwk")
+            result = runner.invoke(
+                cli.cli,
+                [
+                    "convert",
+                    "-i",
+                    "./data/animals.nex",
+                    "-o",
+                    output_path,
+                    "--burnin",
+                    "1",
+                ],
+            )
+            self.assertEqual(result.exit_code, 0)
+            with open(output_path) as file_nwk:
+                lines = file_nwk.read().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith("((raccoon:19.2,bear:6.8)"))
+
+
+class TestConvertFormat(unittest.TestCase):
+    def test_convert_compressed(self):
+        with open("./data/animals.nwk") as file_nwk:
+            expected = newick.write_newick(newick.read_newick(file_nwk.read()))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_path = "./data/animals.nex"
+            for suffix in [".nex.gz", ".json.bz2", ".nwk.xz", ".nwk"]:
+                output_path = os.path.join(tmp_dir, "animals" + suffix)
+                convert_format(input_path, output_path, thin=5)
+                input_path = output_path
+            compressed = os.path.join(tmp_dir, "animals.nex.gz")
+            self.assertEqual(guess_compression(compressed), "gzip")
+            with open(compressed, "rb") as file_gz:
+                self.assertEqual(file_gz.read(2), b"\x1f\x8b")
+            with open_file(os.path.join(tmp_dir, "animals.nwk.xz")) as handle:
+                self.assertEqual(handle.read().strip(), expected)
+
+    def test_convert_json_trees(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, "animals.json")
+            convert_format("./data/animals.nex", output_path)
+            with open(output_path) as file_json:
+                self.assertEqual(len(jt.read_json(file_json.read())), 3)
+
+    def test_compresslevel(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sizes = []
+            for level in [0, 9]:
+                output_path = os.path.join(tmp_dir, f"animals{level}.nwk.gz")
+                convert_format(
+                    "./data/animals.nex", output_path, compresslevel=level
+                )
+                sizes.append(os.path.getsize(output_path))
+            raw_path = os.path.join(tmp_dir, "animals.nwk")
+            convert_format("./data/animals.nex", raw_path)
+            raw_size = os.path.getsize(raw_path)
+        # level 0 stores the data uncompressed
+        self.assertGreaterEqual(sizes[0], raw_size)
+        self.assertGreater(sizes[0], sizes[1])
+
 
 if __name__ == "__main__":
     unittest.main()
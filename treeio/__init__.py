@@ -12,5 +12,6 @@ __version__ = "0.0.0.dev5"
 
 
 from .tree import Tree
+from .utils import LabelTable
 
-__all__ = ["Tree"]
+__all__ = ["Tree", "LabelTable"]
@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2020 Ye Chang <yech1990@gmail.com>
+# Distributed under terms of the MIT license.
+#
+# Created: 2020-04-18 21:05
+
+"""
+Read and convert trees inside an asyncio event loop.
+
+```python
+async for tree in aread("data/animals.nex", burnin=1):
+    ...
+
+await aconvert("data/animals.nex", "animals.nwk")
+```
+
+Files are read chunk by chunk and the parsing runs in an executor, so the
+event loop is never blocked for long. At most `max_pending` trees are
+parsed ahead of the consumer and nothing more is read until it catches
+up.
+"""
+
+import asyncio
+import codecs
+import os
+from collections import deque
+from concurrent.futures import Executor
+from functools import partial
+from itertools import islice
+from typing import AsyncIterator, Deque, Optional, Union
+
+from .jt import read_json
+from .newick import read_newick
+from .nexus import TreesBlock, tree_newick
+from .tree import Tree
+from .treeio import convert_format, guess_format, sniff_format
+from .utils import (
+    CHUNK_SIZE,
+    MAGIC_SIZE,
+    LabelTable,
+    StatementSplitter,
+    StreamDecompressor,
+    check_sampling,
+    open_file,
+    sniff_compression,
+)
+
+
+async def _read_chunks(
+    source, chunk_size: int, executor: Optional[Executor]
+) -> AsyncIterator[str]:
+    """
+    Read text chunks from a path or from a stream with `async read`.
+
+    Compressed paths are handled by `treeio.utils.open_file`, compressed
+    byte streams are detected by their magic bytes and decompressed here.
+    """
+    loop = asyncio.get_running_loop()
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    decompressor = None
+    handle = None
+    if isinstance(source, (str, os.PathLike)):
+        handle = await loop.run_in_executor(executor, open_file, source, "rb")
+        read = partial(loop.run_in_executor, executor, handle.read, chunk_size)
+    else:
+        read = partial(source.read, chunk_size)
+    try:
+        chunk = await read()
+        if handle is None and isinstance(chunk, bytes):
+            while chunk and len(chunk) < MAGIC_SIZE:
+                more = await read()
+                if not more:
+                    break
+                chunk += more
+            compression = sniff_compression(chunk)
+            if compression is not None:
+                decompressor = StreamDecompressor(compression)
+        while chunk:
+            if isinstance(chunk, bytes):
+                if decompressor is not None:
+                    chunk = decompressor.decompress(chunk)
+                chunk = decoder.decode(chunk)
+            if chunk:
+                yield chunk
+            chunk = await read()
+        chunk = decoder.decode(b"", final=True)
+        if chunk:
+            yield chunk
+    finally:
+        if handle is not None:
+            handle.close()
+
+
+async def aread(
+    source: Union[str, os.PathLike, asyncio.StreamReader],
+    fmt: Optional[str] = None,
+    burnin: int = 0,
+    thin: int = 1,
+    labels: Optional[LabelTable] = None,
+    executor: Optional[Executor] = None,
+    chunk_size: int = CHUNK_SIZE,
+    max_pending: int = 4,
+) -> AsyncIterator[Tree]:
+    """
+    Read trees from a path or a stream one by one.
+
+    `source` is a path, which may be compressed, or any object with an
+    `async read(n)` method returning bytes or text, such as
+    `asyncio.StreamReader`. The format is
+    guessed from the content and the extension unless given. Trees are
+    parsed with `executor` (the default executor of the loop if `None`);
+    it should run threads, so that the trees share the `labels` table, a
+    new one per call unless given (see `treeio.newick.read_newick`).
+    """
+    check_sampling(burnin, thin)
+    loop = asyncio.get_running_loop()
+    taxon_ids = labels is not None
+    if labels is None:
+        labels = LabelTable()
+    chunks = _read_chunks(source, chunk_size, executor)
+    try:
+        # sniff the same head as `convert_format`, whatever the chunk size
+        head = ""
+        async for chunk in chunks:
+            head += chunk
+            if len(head.lstrip()) >= 64:
+                break
+        if not head:
+            return
+        if fmt is None:
+            fmt = sniff_format(head)
+        if fmt is None and isinstance(source, (str, os.PathLike)):
+            fmt = guess_format(source)
+
+        if fmt == "json":
+            parts = [head]
+            async for chunk in chunks:
+                parts.append(chunk)
+            trees = await loop.run_in_executor(
+                executor,
+                partial(
+                    read_json,
+                    "".join(parts),
+                    labels=labels if taxon_ids else None,
+                ),
+            )
+            for tree in islice(trees, burnin, None, thin):
+                yield tree
+            return
+        if fmt not in (None, "newick", "nexus"):
+            raise ValueError(f"Unsupported tree format: {fmt}")
+
+        block = TreesBlock(labels, taxon_ids) if fmt == "nexus" else None
+        splitter = StatementSplitter()
+
+        async def _statements():
+            for statement in splitter.feed(head):
+                yield statement
+            async for chunk in chunks:
+                for statement in splitter.feed(chunk):
+                    yield statement
+            for statement in splitter.close():
+                yield statement
+
+        statements = _statements()
+        pending: Deque[asyncio.Future] = deque()
+        index = 0
+        try:
+            async for statement in statements:
+                if block is None:
+                    body = statement if statement.strip() else None
+                else:
+                    body = block.feed(statement)
+                if body is None:
+                    continue
+                if index >= burnin and (index - burnin) % thin == 0:
+                    if block is None:
+                        job = partial(
+                            read_newick,
+                            body,
+                            labels=labels,
+                            taxon_ids=taxon_ids,
+                        )
+                    else:
+                        job = partial(
+                            read_newick,
+                            tree_newick(body),
+                            translate=block.translate,
+                            labels=labels,
+                            taxon_ids=taxon_ids,
+                        )
+                    pending.append(loop.run_in_executor(executor, job))
+                index += 1
+                # stop reading until the consumer takes the parsed trees
+                while len(pending) >= max_pending:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for future in pending:
+                future.cancel()
+            await statements.aclose()
+    finally:
+        await chunks.aclose()
+
+
+async def aconvert(
+    input_path,
+    output_path,
+    input_format: Optional[str] = None,
+    output_format: Optional[str] = None,
+    burnin: int = 0,
+    thin: int = 1,
+    compresslevel: Optional[int] = None,
+    executor: Optional[Executor] = None,
+):
+    """
+    Convert format without blocking the event loop.
+
+    The whole conversion runs as `treeio.treeio.convert_format` in
+    `executor`, which already streams the trees with bounded memory.
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        executor,
+        partial(
+            convert_format,
+            input_path,
+            output_path,
+            input_format=input_format,
+            output_format=output_format,
+            burnin=burnin,
+            thin=thin,
+            compresslevel=compresslevel,
+        ),
+    )
@@ -9,6 +9,7 @@ $$\pi \times x = \frac{x}{y+z}$$
 """
 
 import click
+from .tree import Tree
 from .treeio import convert_format
 
 
@@ -17,6 +18,8 @@ from .treeio import convert_format
 def cli(debug=False):
     """Entry for command group."""
     click.echo("Debug mode is %s" % ("on" if debug else "off"))
+    # validate trees after every change while debugging
+    Tree.set_debug(debug)
 
 
 @cli.command()
@@ -30,11 +33,35 @@ def cli(debug=False):
     required=True,
     help="Path of output file.",
 )
-def convert(input_path, output_path):
+@click.option(
+    "--burnin",
+    type=click.IntRange(0),
+    default=0,
+    help="Number of leading trees to skip.",
+)
+@click.option(
+    "--thin",
+    type=click.IntRange(1),
+    default=1,
+    help="Keep every THIN-th tree.",
+)
+@click.option(
+    "--compresslevel",
+    type=click.IntRange(0, 9),
+    default=None,
+    help="Compression level of .gz/.bz2/.xz output.",
+)
+def convert(input_path, output_path, burnin, thin, compresslevel):
     """Convert tree formats."""
     click.echo(f"input path {input_path}!")
     click.echo(f"input path {output_path}!")
-    convert_format(input_path, output_path)
+    convert_format(
+        input_path,
+        output_path,
+        burnin=burnin,
+        thin=thin,
+        compresslevel=compresslevel,
+    )
 
 
 @cli.command()
@@ -10,10 +10,13 @@
 Read and write json format.
 """
 
+import io
 import json
-from typing import List
+from itertools import chain, islice
+from typing import Iterable, List, Optional, TextIO
 
 from .tree import Tree
+from .utils import LabelTable
 
 
 def read_json(
@@ -22,6 +25,7 @@ def read_json(
     child_key="children",
     dist_key="branch_length",
     supp_key="support",
+    labels: Optional[LabelTable] = None,
 ) -> List[Tree]:
     """Return a json object in the format desribed below
 
@@ -51,9 +55,16 @@ def read_json(
       ]
     }
     ```
+
+    Leaf names are interned in `labels`, a new table per call unless given,
+    and leaves get their `taxon_id` only when it is given (see
+    `treeio.newick.read_newick`).
     """
 
     data = json.loads(json_string)
+    taxon_ids = labels is not None
+    if labels is None:
+        labels = LabelTable()
     # assert type(data) is dict, "Only single tree is supported."
 
     tree_scratch = Tree("scratch")
@@ -67,9 +78,15 @@ def read_json(
                 supp=obj.get(supp_key),
             )
             tree_cur.append_child(node)
-            if child_key in obj:
+            # `"children": []` is a leaf as well
+            if obj.get(child_key):
                 tree_cur = node
                 _parse_node(obj[child_key], tree_cur)
+            elif node.name is not None:
+                taxon_id = labels.add(node.name)
+                node.name = labels[taxon_id]
+                if taxon_ids:
+                    node.taxon_id = taxon_id
         elif isinstance(obj, list):
             for item in obj:
                 _parse_node(item, tree_cur)
@@ -79,29 +96,60 @@ def read_json(
     return [t.isolated() for t in tree_scratch.children]
 
 
-def write_json(
-    trees: List[Tree],
+def _record_node(node, name_key, child_key, dist_key, supp_key):
+    attr_key = ["name", "dist", "supp"]
+    attr_values = [name_key, dist_key, supp_key]
+    data = {v: getattr(node, k) for k, v in zip(attr_key, attr_values)}
+    children = [
+        _record_node(child, name_key, child_key, dist_key, supp_key)
+        for child in node.children
+    ]
+    if children:
+        data[child_key] = children
+    return data
+
+
+def dump_json(
+    trees: Iterable[Tree],
+    handle: TextIO,
     name_key="name",
     child_key="children",
     dist_key="branch_length",
     supp_key="support",
-) -> str:
-    """Return a json object in the format desribed below
+) -> None:
     """
+    Write trees into an opened file in json format.
 
-    def _record_node(node):
-        attr_key = ["name", "dist", "supp"]
-        attr_values = [name_key, dist_key, supp_key]
-        data = {v: getattr(node, k) for k, v in zip(attr_key, attr_values)}
-        children = [_record_node(child) for child in node.children]
-        if children:
-            data[child_key] = children
-        return data
+    A single tree is written as one object (see `read_json`), any other
+    number of trees as a list of such objects. Trees are written one by
+    one, so they are never all held in memory.
+    """
+    keys = (name_key, child_key, dist_key, supp_key)
+    trees = iter(trees)
+    # look ahead to tell a single tree from a list
+    head = list(islice(trees, 2))
+    if len(head) == 1:
+        handle.write(json.dumps(_record_node(head[0], *keys)))
+        return
+    handle.write("[")
+    for index, tree in enumerate(chain(head, trees)):
+        if index:
+            handle.write(", ")
+        handle.write(json.dumps(_record_node(tree, *keys)))
+    handle.write("]")
 
-    data = _record_node(trees[0])
 
-    json_string = json.dumps(data)
-    return json_string
+def write_json(
+    trees: Iterable[Tree],
+    name_key="name",
+    child_key="children",
+    dist_key="branch_length",
+    supp_key="support",
+) -> str:
+    """Write trees into string in json format, see `dump_json`."""
+    handle = io.StringIO()
+    dump_json(trees, handle, name_key, child_key, dist_key, supp_key)
+    return handle.getvalue()
 
 
 if __name__ == "__main__":
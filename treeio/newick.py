@@ -10,15 +10,208 @@
 Read and write newick format.
 """
 
+import re
+from typing import Iterable, Iterator, List, Mapping, Optional, TextIO
+
 from .tree import Tree
+from .utils import LabelTable, check_sampling, iter_statements
+
+_TOKEN = re.compile(
+    r"\s*(?:(\[[^\]]*\])|('(?:[^']|'')*')|([(),:;])|([^\s()\[\]',:;]+))"
+)
+_UNQUOTED = re.compile(r"[^\s()\[\]',:;]+")
+
+
+def _unquote(label: str) -> str:
+    return label[1:-1].replace("''", "'")
+
+
+def _quote(label: str) -> str:
+    if _UNQUOTED.fullmatch(label):
+        return label
+    return "'" + label.replace("'", "''") + "'"
+
+
+def _as_float(value: str) -> Optional[float]:
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def read_newick(
+    nwk_string: str,
+    translate: Optional[Mapping[str, str]] = None,
+    labels: Optional[LabelTable] = None,
+    taxon_ids: Optional[bool] = None,
+) -> Tree:
+    """
+    Read newick file into Tree object.
+
+    Only the first tree of `nwk_string` is read, and the terminating `;`
+    may be omitted. Leaf labels are looked up in `translate` (a NEXUS
+    `TRANSLATE` table) when given, and are then interned in `labels`, so
+    that the same taxon name is one string object across trees read with
+    the same table. Leaves get their `taxon_id` in the table if
+    `taxon_ids`, by default only when `labels` is given, as ids from
+    different tables can not be compared. Numeric labels of internal nodes
+    are read as support values.
+    """
+    if taxon_ids is None:
+        taxon_ids = labels is not None
+    if labels is None:
+        labels = LabelTable()
+    stack: List[List[Tree]] = []
+    node: Optional[Tree] = None
+    # whether `node` already got its label / its branch length
+    has_label = has_dist = False
+    is_dist = False
+    pos = 0
+    end = len(nwk_string)
+    while pos < end:
+        match = _TOKEN.match(nwk_string, pos)
+        if match is None:
+            if not nwk_string[pos:].strip():
+                break
+            raise ValueError(f"Invalid newick string at position {pos}.")
+        pos = match.end()
+        comment, quoted, punct, plain = match.groups()
+        if comment is not None:
+            continue
+        if punct is None:
+            label = plain if quoted is None else _unquote(quoted)
+            if is_dist:
+                if node is None:
+                    raise ValueError("Branch length without node.")
+                node.dist = float(label)
+                is_dist = False
+                has_dist = True
+            elif node is None:
+                if translate is not None and label in translate:
+                    label = translate[label]
+                taxon_id = labels.add(label)
+                node = Tree(labels[taxon_id])
+                if taxon_ids:
+                    node.taxon_id = taxon_id
+                has_label = True
+            elif has_label or has_dist:
+                raise ValueError(f"Unexpected label at position {pos}.")
+            else:
+                has_label = True
+                supp = None if quoted is not None else _as_float(label)
+                if supp is None:
+                    node.name = label
+                else:
+                    node.supp = supp
+        elif punct == ":":
+            if is_dist or has_dist:
+                raise ValueError(f"Unexpected ':' at position {pos}.")
+            if node is None:
+                node = Tree()
+            is_dist = True
+        elif punct == "(":
+            if node is not None:
+                raise ValueError(f"Unexpected '(' at position {pos}.")
+            stack.append([])
+        elif not stack and punct != ";":
+            raise ValueError(f"Unbalanced '{punct}' at position {pos}.")
+        else:
+            if node is None:
+                node = Tree()
+            if punct == ";":
+                break
+            stack[-1].append(node)
+            node = None
+            has_label = has_dist = False
+            if punct == ")":
+                node = Tree()
+                node.children = stack.pop()
+    if stack:
+        raise ValueError("Unbalanced '(' in newick string.")
+    if node is None:
+        raise ValueError("Empty newick string.")
+    return node
+
+
+def iter_newick(
+    handle: Iterable[str],
+    translate: Optional[Mapping[str, str]] = None,
+    labels: Optional[LabelTable] = None,
+    burnin: int = 0,
+    thin: int = 1,
+) -> Iterator[Tree]:
+    """
+    Read trees from a stream of newick text one by one.
+
+    `handle` can be an opened file or any iterable of text chunks. The
+    first `burnin` trees are dropped and then only every `thin`-th tree is
+    kept; dropped trees are never parsed. All trees share the `labels`
+    table, a new one per call unless given (see `read_newick`).
+    """
+    check_sampling(burnin, thin)
+    taxon_ids = labels is not None
+    if labels is None:
+        labels = LabelTable()
+    return _iter_newick(handle, translate, labels, taxon_ids, burnin, thin)
+
+
+def _iter_newick(handle, translate, labels, taxon_ids, burnin, thin):
+    index = 0
+    for statement in iter_statements(handle):
+        if not statement.strip():
+            continue
+        if index >= burnin and (index - burnin) % thin == 0:
+            yield read_newick(
+                statement,
+                translate=translate,
+                labels=labels,
+                taxon_ids=taxon_ids,
+            )
+        index += 1
+
 
+def write_newick(
+    tree: Tree, translate: Optional[Mapping[str, str]] = None
+) -> str:
+    """
+    Write Tree object into string in newick format.
 
-def read_newick(nwk_string: str) -> Tree:
-    """Read newick file into Tree object."""
-    return Tree()
+    Leaf names found in `translate` are replaced by their key, which is how
+    trees are written under a NEXUS `TRANSLATE` table.
+    """
+    parts = []
+    # walk with an explicit stack so that deep trees do not hit the
+    # recursion limit; `None` marks a literal comma
+    stack = [(tree, False)]
+    while stack:
+        node, is_closing = stack.pop()
+        if node is None:
+            parts.append(",")
+            continue
+        if node.children and not is_closing:
+            parts.append("(")
+            stack.append((node, True))
+            for i, child in enumerate(reversed(node.children)):
+                if i:
+                    stack.append((None, False))
+                stack.append((child, False))
+            continue
+        if is_closing:
+            parts.append(")")
+        if is_closing and node.supp is not None:
+            parts.append(str(node.supp))
+        elif not is_closing and translate and node.name in translate:
+            parts.append(translate[node.name])
+        elif node.name and node.name != "unknown":
+            parts.append(_quote(node.name))
+        if node.dist is not None:
+            parts.append(f":{node.dist}")
+    parts.append(";")
+    return "".join(parts)
 
 
-def write_newick(tree: Tree) -> str:
-    """Write Tree object into string in newick format."""
-    nwk_string = ""
-    return nwk_string
+def dump_newick(trees: Iterable[Tree], handle: TextIO) -> None:
+    """Write trees into an opened file, one tree per line."""
+    for tree in trees:
+        handle.write(write_newick(tree))
+        handle.write("\n")
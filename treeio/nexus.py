@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2020 Ye Chang <yech1990@gmail.com>
+# Distributed under terms of the MIT license.
+#
+# Created: 2020-04-12 10:21
+
+"""
+Read and write nexus format.
+
+Only the `TREES` block is interpreted, which is what MrBayes and BEAST
+write their samples into:
+
+```
+#NEXUS
+begin trees;
+    translate
+        1 raccoon,
+        2 bear,
+        3 dog
+    ;
+    tree gen.1000 = [&U] ((1:19.2,2:6.8):0.85,3:25.5);
+    ...
+end;
+```
+"""
+
+import io
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO
+
+from .newick import _quote, _unquote, read_newick, write_newick
+from .tree import Tree
+from .utils import LabelTable, check_sampling, iter_statements
+
+_COMMAND = re.compile(
+    r"\s*(?:#nexus)?(?:\s*\[[^\]]*\])*\s*(\w+)", re.IGNORECASE
+)
+_COMMENT = re.compile(r"\[[^\]]*\]")
+# `tree name [&comments] = newick`, as written by MrBayes and BEAST
+_TREE = re.compile(
+    r"\s*\*?\s*('(?:[^']|'')*'|[^\s=\[]+)(?:\s*\[[^\]]*\])*\s*=(.*)",
+    re.DOTALL,
+)
+_TRANSLATE = re.compile(
+    r"\s*('(?:[^']|'')*'|[^\s,]+)\s+('(?:[^']|'')*'|[^\s,]+)\s*(?:,|$)"
+)
+
+
+def _label(token: str) -> str:
+    token = token.strip()
+    return _unquote(token) if token.startswith("'") else token
+
+
+def _read_translate(body: str, labels: LabelTable) -> Dict[str, str]:
+    translate = {}
+    body = _COMMENT.sub("", body).rstrip()
+    pos = 0
+    while pos < len(body):
+        match = _TRANSLATE.match(body, pos)
+        if match is None:
+            raise ValueError(f"Invalid translate entry: {body[pos:]}")
+        pos = match.end()
+        key, label = _label(match.group(1)), _label(match.group(2))
+        translate[key] = labels.intern(label)
+    return translate
+
+
+class TreesBlock:
+    """
+    State of the `TREES` block while reading nexus statements in order.
+
+    Statements are fed one by one (see `treeio.utils.StatementSplitter`)
+    and tree commands are returned unparsed, so that readers can skip or
+    defer the parsing.
+    """
+
+    def __init__(self, labels: LabelTable, taxon_ids: bool = True):
+        """Init."""
+        self.labels = labels
+        # whether leaves get their `taxon_id`, see `read_newick`
+        self.taxon_ids = taxon_ids
+        self.translate: Optional[Dict[str, str]] = None
+        self._in_trees = False
+
+    def feed(self, statement: str) -> Optional[str]:
+        """Return the body of a tree command, `None` for other commands."""
+        match = _COMMAND.match(statement)
+        if match is None:
+            return None
+        command = match.group(1).lower()
+        body = statement[match.end() :]
+        if command == "begin":
+            self._in_trees = body.strip().lower() == "trees"
+            self.translate = None
+        elif command in ("end", "endblock"):
+            self._in_trees = False
+        elif not self._in_trees:
+            pass
+        elif command == "translate":
+            self.translate = _read_translate(body, self.labels)
+        elif command in ("tree", "utree"):
+            return body
+        return None
+
+    def read_tree(self, body: str) -> Tree:
+        """Parse the body of a tree command returned by `feed`."""
+        return read_newick(
+            tree_newick(body),
+            translate=self.translate,
+            labels=self.labels,
+            taxon_ids=self.taxon_ids,
+        )
+
+
+def tree_newick(body: str) -> str:
+    """Return the newick string of a tree command body."""
+    match = _TREE.match(body)
+    if match is None:
+        raise ValueError(f"Invalid tree command: {body}")
+    return match.group(2)
+
+
+def iter_nexus(
+    handle: Iterable[str],
+    labels: Optional[LabelTable] = None,
+    burnin: int = 0,
+    thin: int = 1,
+) -> Iterator[Tree]:
+    """
+    Read the trees of a nexus file one by one.
+
+    `handle` can be an opened file or any iterable of text chunks, so the
+    `TREES` block is never loaded into memory at once. Tip labels are
+    resolved through the `TRANSLATE` table and interned in `labels`, a new
+    table per call unless given (see `treeio.newick.read_newick`). The first `burnin` trees are dropped
+    and then only every `thin`-th tree is kept; dropped trees are never
+    parsed.
+    """
+    check_sampling(burnin, thin)
+    if labels is None:
+        block = TreesBlock(LabelTable(), taxon_ids=False)
+    else:
+        block = TreesBlock(labels)
+    return _iter_nexus(handle, block, burnin, thin)
+
+
+def _iter_nexus(handle, block, burnin, thin):
+    index = 0
+    for statement in iter_statements(handle):
+        body = block.feed(statement)
+        if body is None:
+            continue
+        if index >= burnin and (index - burnin) % thin == 0:
+            yield block.read_tree(body)
+        index += 1
+
+
+def read_nexus(
+    nexus_string: str,
+    labels: Optional[LabelTable] = None,
+    burnin: int = 0,
+    thin: int = 1,
+) -> List[Tree]:
+    """Read all trees of the `TREES` block in a nexus string."""
+    return list(
+        iter_nexus(
+            io.StringIO(nexus_string), labels=labels, burnin=burnin, thin=thin
+        )
+    )
+
+
+def dump_nexus(trees: Iterable[Tree], handle: TextIO) -> None:
+    """
+    Write trees into an opened file as nexus `TREES` blocks.
+
+    Leaves are written with the short keys of a `TRANSLATE` table. Every
+    leaf name must be in the table, or it could be read back as the taxon
+    of a key, so a tree with new leaf names starts a new `TREES` block
+    with the table extended. Trees sampled over the same taxa all go into
+    one block.
+    """
+    handle.write("#NEXUS\n")
+    translate: Dict[str, str] = {}
+    index = 0
+    for index, tree in enumerate(trees, 1):
+        names = [
+            n.name for n in tree.leaves() if n.name and n.name not in translate
+        ]
+        if index == 1 or names:
+            if index > 1:
+                handle.write("end;\n")
+            handle.write("begin trees;\n")
+            for name in names:
+                translate.setdefault(name, str(len(translate) + 1))
+            if translate:
+                entries = ",\n".join(
+                    f"        {key} {_quote(name)}"
+                    for name, key in translate.items()
+                )
+                handle.write(f"    translate\n{entries}\n    ;\n")
+        handle.write(
+            f"    tree tree_{index} = {write_newick(tree, translate)}\n"
+        )
+    if index == 0:
+        handle.write("begin trees;\n")
+    handle.write("end;\n")
+
+
+def write_nexus(trees: Iterable[Tree]) -> str:
+    """Write trees into string in nexus format."""
+    handle = io.StringIO()
+    dump_nexus(trees, handle)
+    return handle.getvalue()
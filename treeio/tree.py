@@ -8,14 +8,115 @@
 
 """Tree class."""
 
-
 from __future__ import annotations
 
-from typing import Optional, Iterable, List
+import math
+from functools import wraps
+from numbers import Real
+from typing import Dict, FrozenSet, Iterator, Optional, Iterable, List, Union
 from itertools import chain
 
 from .utils import dedup
 
+# numeric attributes checked by `Tree.set_debug`
+_NUMBERS = ["dist", "supp"]
+# original definitions of the mutators while debugging
+_ORIGINALS: Dict[str, object] = {}
+
+
+def _check_number(node: Tree, key: str, value) -> None:
+    """Raise `ValueError` if value is neither `None` nor a finite number."""
+    if value is not None and (
+        not isinstance(value, Real)
+        or isinstance(value, bool)
+        or not math.isfinite(value)
+    ):
+        raise ValueError(f"Invalid {key} of {node!r}: {value!r}")
+
+
+def _check_attach(parent: Tree, nodes: Iterable[Tree]) -> None:
+    """Raise `ValueError` if putting nodes under parent makes a cycle."""
+    ancestors = set()
+    node: Optional[Tree] = parent
+    while node is not None:
+        if id(node) in ancestors:
+            raise ValueError(f"Cycle in the ancestors of {parent!r}.")
+        ancestors.add(id(node))
+        node = node._parent
+    for node in nodes:
+        if id(node) in ancestors:
+            raise ValueError(
+                f"{node!r} can not be a child of {parent!r}, "
+                "which is itself or one of its descendants."
+            )
+
+
+def _check_parents(child: Tree, nodes: Iterable[Tree]) -> None:
+    """Raise `ValueError` if putting child under any of nodes makes a cycle."""
+    for node in nodes:
+        _check_attach(node, [child])
+
+
+# mutators wrapped by `Tree.set_debug` -> check before attaching new nodes
+_MUTATORS = {
+    "parent": _check_parents,
+    "children": _check_attach,
+    "append_child": _check_attach,
+    "extend_children": _check_attach,
+    "remove_child": None,
+    "isolated": None,
+}
+
+
+def _materialize(value):
+    if hasattr(value, "__iter__") and not isinstance(value, (Tree, str)):
+        return list(value)
+    return value
+
+
+def _validating(method, precheck):
+    """
+    Wrap a mutator to validate every tree it touched afterwards.
+
+    Cycles are rejected by `precheck` before the mutation, so that a
+    failing check does not leave a looping tree behind.
+    """
+    attaches = precheck is not None
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if attaches:
+            # children may be given as a one-shot iterator
+            args = tuple(map(_materialize, args))
+            kwargs = {k: _materialize(v) for k, v in kwargs.items()}
+        nodes = []
+        for arg in chain(args, kwargs.values()):
+            if isinstance(arg, Tree):
+                nodes.append(arg)
+            elif isinstance(arg, (list, tuple)):
+                nodes.extend(n for n in arg if isinstance(n, Tree))
+        if attaches:
+            precheck(self, nodes)
+        result = method(self, *args, **kwargs)
+        for node in [self] + nodes:
+            node.root().validate()
+        return result
+
+    return wrapper
+
+
+def _validating_number(key: str) -> property:
+    """Make a property checking the numeric attribute key when set."""
+
+    def fget(self):
+        return self.__dict__[key]
+
+    def fset(self, value):
+        _check_number(self, key, value)
+        self.__dict__[key] = value
+
+    return property(fget, fset)
+
 
 class Tree:
     """
@@ -33,6 +134,8 @@ class Tree:
         self.name: str = name
         self.dist: Optional[float] = dist
         self.supp: Optional[float] = supp
+        # index of a leaf label in the `LabelTable` given to the reader
+        self.taxon_id: Optional[int] = None
         self._parent: Optional[Tree] = None
         self._children: List[Tree] = []
         # support any value
@@ -50,7 +153,7 @@ class Tree:
         return f"<Tree: {self.name}>"
 
     def __str__(self):
-        """ Print tree in console by ascii art."""
+        """Print tree in console by ascii art."""
         # return self.as_ascii()
         from .show import tree2ascii
 
@@ -62,13 +165,18 @@ class Tree:
         return self._parent
 
     @parent.setter
-    def parent(self, value: Tree) -> None:
-        if isinstance(value, type(self)) or value is None:
-            self._parent = value
+    def parent(self, value: Optional[Tree]) -> None:
+        if not (isinstance(value, type(self)) or value is None):
+            raise ValueError("Parent should be a tree node or None.")
+        if value is self._parent:
+            return
+        if self._parent is not None:
+            p = self._parent
+            p._children = [c for c in p._children if c is not self]
+        self._parent = value
+        if value is not None:
             # should not use `.children`, or will set twice
             value._children.append(self)
-        else:
-            raise ValueError("xxx")
 
     @parent.deleter
     def parent(self):
@@ -81,15 +189,24 @@ class Tree:
 
     @children.setter
     def children(self, value: Iterable[Tree]) -> None:
-        if hasattr(value, "__iter__") and all(
-            isinstance(n, type(self)) for n in value
-        ):
-            self._children = dedup(value)
-            for node in value:
-                # should not use `.parent`, or will set twice
-                node._parent = self
-        else:
-            raise ValueError("xxx")
+        if not hasattr(value, "__iter__"):
+            raise ValueError("Children should be an iterable of tree nodes.")
+        children = list(value)
+        if not all(isinstance(n, type(self)) for n in children):
+            raise ValueError("Children should be an iterable of tree nodes.")
+        children = dedup(children)
+        kept = set(map(id, children))
+        for node in self._children:
+            if id(node) not in kept:
+                node._parent = None
+        for node in children:
+            p = node._parent
+            # a node has one parent, move it out of the previous one
+            if p is not None and p is not self:
+                p._children = [c for c in p._children if c is not node]
+            # should not use `.parent`, or will set twice
+            node._parent = self
+        self._children = children
 
     @children.deleter
     def children(self):
@@ -105,7 +222,8 @@ class Tree:
         return self
 
     def remove_child(self, tree):
-        assert self.parent is self, "The input node is not a child node."
+        if tree.parent is not self:
+            raise ValueError("The input node is not a child node.")
         tree._parent = None
         self._children = [c for c in self.children if c is not tree]
         return self
@@ -119,6 +237,102 @@ class Tree:
         self._parent = None
         return self
 
+    def leaves(self) -> Iterator[Tree]:
+        """Iterate over the leaves under this node, from left to right."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.children:
+                stack.extend(reversed(node.children))
+            else:
+                yield node
+
+    def taxa(self) -> FrozenSet[Union[int, str]]:
+        """
+        Get the set of taxa under this node.
+
+        Leaves are represented by their `taxon_id` when read with a given
+        `LabelTable`, which is cheaper to hash and compare than their
+        names, and by their name otherwise. Sets from trees read with
+        different tables do not compare meaningfully.
+        """
+        return frozenset(
+            n.name if n.taxon_id is None else n.taxon_id for n in self.leaves()
+        )
+
+    def root(self) -> Tree:
+        """Get the root node of the tree containing this node."""
+        node = self
+        seen = set()
+        while node._parent is not None:
+            if id(node) in seen:
+                raise ValueError(f"Cycle in the ancestors of {self!r}.")
+            seen.add(id(node))
+            node = node._parent
+        return node
+
+    def validate(self) -> Tree:
+        """
+        Check the structure of the tree under this node.
+
+        Raise `ValueError` if a child does not point back to its parent, a
+        node is reached twice (cycle, or node shared by two parents), or a
+        `dist`/`supp` value is not a finite number. Runs in O(n) without
+        recursion.
+        """
+        seen = set()
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                raise ValueError(f"{node!r} is reached twice, cycle in tree.")
+            seen.add(id(node))
+            for key in _NUMBERS:
+                _check_number(node, key, getattr(node, key))
+            for child in node._children:
+                if child._parent is not node:
+                    raise ValueError(
+                        f"{child!r} is a child of {node!r}, "
+                        f"but its parent is {child._parent!r}."
+                    )
+                stack.append(child)
+        return self
+
+    @staticmethod
+    def set_debug(enabled: bool = True) -> None:
+        """
+        Validate the trees after every mutation, for debugging.
+
+        Structural mutators refuse to create cycles and validate the trees
+        they touched, and `dist`/`supp` are checked whenever they are set.
+        The checking code is only swapped in while enabled, so the default
+        mode has no extra cost, and does not check anything either.
+        """
+        if enabled == bool(_ORIGINALS):
+            return
+        if not enabled:
+            for name, attr in _ORIGINALS.items():
+                setattr(Tree, name, attr)
+            _ORIGINALS.clear()
+            for key in _NUMBERS:
+                delattr(Tree, key)
+            return
+        for name, precheck in _MUTATORS.items():
+            attr = Tree.__dict__[name]
+            _ORIGINALS[name] = attr
+            if isinstance(attr, property):
+                attr = property(
+                    attr.fget,
+                    _validating(attr.fset, precheck),
+                    attr.fdel,
+                    attr.__doc__,
+                )
+            else:
+                attr = _validating(attr, precheck)
+            setattr(Tree, name, attr)
+        for key in _NUMBERS:
+            setattr(Tree, key, _validating_number(key))
+
     def is_leaf(self):
         """Chech node is a leaf(terminal node) or not."""
         return len(self.children) == 0
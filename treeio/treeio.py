@@ -2,13 +2,110 @@
 
 """Main module."""
 
-from pathlib import Path
-from .newick import read_newick, write_newick
+import re
+from itertools import islice
+from typing import Iterable, Iterator, Optional, TextIO
 
+from .jt import dump_json, read_json
+from .newick import dump_newick, iter_newick
+from .nexus import dump_nexus, iter_nexus
+from .tree import Tree
+from .utils import (
+    LabelTable,
+    check_sampling,
+    iter_chunks,
+    open_file,
+    strip_compression,
+)
 
-def convert_format(input_path, output_path):
-    """Convert format."""
-    input_string = Path(input_path).read_text()
-    tree = read_newick(input_string)
-    output_string = write_newick(tree)
-    Path(output_path).write_text(output_string)
+FORMATS = {
+    ".json": "json",
+    ".nwk": "newick",
+    ".newick": "newick",
+    ".tre": "newick",
+    ".tree": "newick",
+    ".nex": "nexus",
+    ".nexus": "nexus",
+    ".trees": "nexus",
+    ".t": "nexus",
+}
+
+_JSON_HEAD = re.compile(r"\s*(\{|\[\s*\{)")
+
+
+def guess_format(path) -> str:
+    """Guess tree format from the file extension, defaulting to newick."""
+    return FORMATS.get(strip_compression(path).suffix.lower(), "newick")
+
+
+def sniff_format(head: str) -> Optional[str]:
+    """Guess tree format from the first characters of a file, if possible."""
+    if head.lstrip()[:6].upper() == "#NEXUS":
+        return "nexus"
+    if _JSON_HEAD.match(head):
+        return "json"
+    return None
+
+
+def iter_trees(
+    handle: TextIO,
+    fmt: str,
+    burnin: int = 0,
+    thin: int = 1,
+    labels: Optional[LabelTable] = None,
+) -> Iterator[Tree]:
+    """Read trees of format `fmt` from an opened file one by one."""
+    chunks = iter_chunks(handle)
+    if fmt == "nexus":
+        return iter_nexus(chunks, labels=labels, burnin=burnin, thin=thin)
+    if fmt == "newick":
+        return iter_newick(chunks, labels=labels, burnin=burnin, thin=thin)
+    if fmt == "json":
+        check_sampling(burnin, thin)
+        trees = read_json(handle.read(), labels=labels)
+        return islice(trees, burnin, None, thin)
+    raise ValueError(f"Unsupported tree format: {fmt}")
+
+
+def dump_trees(trees: Iterable[Tree], handle: TextIO, fmt: str) -> None:
+    """Write trees of format `fmt` into an opened file."""
+    if fmt == "nexus":
+        dump_nexus(trees, handle)
+    elif fmt == "newick":
+        dump_newick(trees, handle)
+    elif fmt == "json":
+        dump_json(trees, handle)
+    else:
+        raise ValueError(f"Unsupported tree format: {fmt}")
+
+
+def convert_format(
+    input_path,
+    output_path,
+    input_format: Optional[str] = None,
+    output_format: Optional[str] = None,
+    burnin: int = 0,
+    thin: int = 1,
+    compresslevel: Optional[int] = None,
+):
+    """
+    Convert format.
+
+    Formats are guessed from the file content and extensions unless given.
+    Newick and nexus input is streamed tree by tree, with `burnin` and
+    `thin` applied before the skipped trees are parsed, and all formats
+    are written tree by tree; only json input is loaded at once. Compressed files
+    are handled on the fly (see `treeio.utils.open_file`).
+    """
+    output_format = output_format or guess_format(output_path)
+    with open_file(input_path) as input_handle:
+        # `#NEXUS` files are often named `.tre` as well
+        input_format = (
+            input_format
+            or sniff_format(input_handle.read(64))
+            or guess_format(input_path)
+        )
+        input_handle.seek(0)
+        trees = iter_trees(input_handle, input_format, burnin, thin)
+        with open_file(output_path, "w", compresslevel) as output_handle:
+            dump_trees(trees, output_handle, output_format)
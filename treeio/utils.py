@@ -8,6 +8,41 @@
 
 """Common functions."""
 
+import bz2
+import gzip
+import lzma
+import re
+import threading
+import zlib
+from functools import partial
+from pathlib import Path
+from typing import IO, Dict, Iterable, Iterator, List, Optional
+
+CHUNK_SIZE = 1 << 16
+
+# compression -> (magic bytes, file extension, opener)
+COMPRESSIONS = {
+    "gzip": (b"\x1f\x8b", ".gz", gzip.open),
+    "bz2": (b"BZh", ".bz2", bz2.open),
+    "xz": (b"\xfd7zXZ\x00", ".xz", lzma.open),
+}
+MAGIC_SIZE = 6
+
+# compression -> incremental decompressor, for streams without a file
+DECOMPRESSORS = {
+    "gzip": partial(zlib.decompressobj, wbits=zlib.MAX_WBITS | 16),
+    "bz2": bz2.BZ2Decompressor,
+    "xz": lzma.LZMADecompressor,
+}
+
+
+def check_sampling(burnin: int, thin: int) -> None:
+    """Check the `burnin` and `thin` arguments of the tree readers."""
+    if burnin < 0:
+        raise ValueError(f"burnin should be 0 or more, not {burnin}.")
+    if thin < 1:
+        raise ValueError(f"thin should be 1 or more, not {thin}.")
+
 
 def dedup(seq):
     """
@@ -18,3 +53,217 @@ def dedup(seq):
     seen = set()
     seen_add = seen.add
     return [x for x in seq if not (x in seen or seen_add(x))]
+
+
+def strip_compression(path) -> Path:
+    """Drop the compression extension of path, `a.nwk.gz` -> `a.nwk`."""
+    path = Path(path)
+    for _, suffix, _ in COMPRESSIONS.values():
+        if path.suffix.lower() == suffix:
+            return path.with_suffix("")
+    return path
+
+
+def sniff_compression(magic: bytes) -> Optional[str]:
+    """Guess the compression from the first bytes of a file, if any."""
+    for compression, (prefix, _, _) in COMPRESSIONS.items():
+        if magic.startswith(prefix):
+            return compression
+    return None
+
+
+class StreamDecompressor:
+    """
+    Decompress a stream of gzip/bz2/xz bytes fed block by block.
+
+    Concatenated members (as written by `bgzip` or `cat a.gz b.gz`) are
+    decompressed one after the other.
+    """
+
+    def __init__(self, compression: str):
+        """Init."""
+        self._new = DECOMPRESSORS[compression]
+        self._decompressor = self._new()
+
+    def decompress(self, data: bytes) -> bytes:
+        """Return the bytes decompressed from data."""
+        parts = []
+        while data:
+            parts.append(self._decompressor.decompress(data))
+            if not self._decompressor.eof:
+                break
+            data = self._decompressor.unused_data
+            self._decompressor = self._new()
+        return b"".join(parts)
+
+
+def guess_compression(path, mode: str = "r") -> Optional[str]:
+    """
+    Guess the compression of a file.
+
+    Files to read are detected by their magic bytes, files to write by
+    their extension. Return `None` for plain files.
+    """
+    if "r" in mode:
+        with open(path, "rb") as handle:
+            return sniff_compression(handle.read(MAGIC_SIZE))
+    suffix = Path(path).suffix.lower()
+    for compression, (_, extension, _) in COMPRESSIONS.items():
+        if suffix == extension:
+            return compression
+    return None
+
+
+def open_file(
+    path, mode: str = "rt", compresslevel: Optional[int] = None
+) -> IO:
+    """
+    Open a plain or gzip/bz2/xz compressed file.
+
+    Data is (de)compressed on the fly as the file is read or written, so a
+    compressed file is never held in memory. `compresslevel` (0-9) trades
+    speed for size when writing, defaulting to the library level.
+    """
+    compression = guess_compression(path, mode)
+    kwargs = {}
+    if "b" not in mode:
+        mode = mode if "t" in mode else mode + "t"
+        kwargs["encoding"] = "utf-8"
+    if compression is None:
+        return open(path, mode, **kwargs)
+    if compresslevel is not None and "r" not in mode:
+        if compression == "xz":
+            kwargs["preset"] = compresslevel
+        elif compression == "bz2":
+            # bz2 has no level 0
+            kwargs["compresslevel"] = max(compresslevel, 1)
+        else:
+            kwargs["compresslevel"] = compresslevel
+    return COMPRESSIONS[compression][2](path, mode, **kwargs)
+
+
+def iter_chunks(handle: IO, size: int = CHUNK_SIZE) -> Iterator:
+    """Read an opened file in blocks of `size` instead of by lines."""
+    return iter(partial(handle.read, size), handle.read(0))
+
+
+_SPECIAL = {
+    # state -> pattern of the next character that may change the state
+    "text": re.compile(r"[;'\[]"),
+    "quote": re.compile(r"'"),
+    "comment": re.compile(r"\]"),
+}
+
+
+class StatementSplitter:
+    """
+    Split text fed chunk by chunk into `;`-terminated statements.
+
+    Semicolons inside `'quoted labels'` and `[comments]` are kept, so the
+    chunks may be cut anywhere (lines, fixed-size blocks, ...). The
+    terminating `;` is dropped.
+    """
+
+    def __init__(self):
+        """Init."""
+        self._state = "text"
+        self._pending: List[str] = []
+
+    def feed(self, chunk: str) -> List[str]:
+        """Return the statements completed by chunk."""
+        statements = []
+        state = self._state
+        start = pos = 0
+        while True:
+            match = _SPECIAL[state].search(chunk, pos)
+            if match is None:
+                break
+            pos = match.end()
+            char = match.group()
+            if state == "text":
+                if char == ";":
+                    self._pending.append(chunk[start : pos - 1])
+                    statements.append("".join(self._pending))
+                    self._pending = []
+                    start = pos
+                elif char == "'":
+                    state = "quote"
+                else:
+                    state = "comment"
+            else:
+                # `''` inside a quoted label re-enters the quote at once
+                state = "text"
+        self._pending.append(chunk[start:])
+        self._state = state
+        return statements
+
+    def close(self) -> List[str]:
+        """Return the trailing unterminated statement, if not blank."""
+        statement = "".join(self._pending)
+        self._pending = []
+        return [statement] if statement.strip() else []
+
+
+def iter_statements(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Split a stream of text chunks into `;`-terminated statements.
+
+    See `StatementSplitter`, a trailing unterminated statement is yielded
+    as is if it is not blank.
+    """
+    splitter = StatementSplitter()
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+    yield from splitter.close()
+
+
+class LabelTable:
+    """
+    Shared table of labels, each with a compact integer id.
+
+    Readers given the same table return one string object per distinct
+    label, so that many trees over the same taxa do not hold a copy of
+    every name, and leaves can be compared by their integer `taxon_id`.
+    Ids are only meaningful within one table: pass the same table to every
+    reader whose trees are to be compared.
+    """
+
+    def __init__(self, labels: Iterable[str] = ()):
+        """Init."""
+        self._ids: Dict[str, int] = {}
+        self._labels: List[str] = []
+        self._lock = threading.Lock()
+        for label in labels:
+            self.add(label)
+
+    def __len__(self):
+        return len(self._labels)
+
+    def __iter__(self):
+        return iter(self._labels)
+
+    def __contains__(self, label):
+        return label in self._ids
+
+    def __getitem__(self, taxon_id: int) -> str:
+        return self._labels[taxon_id]
+
+    def __repr__(self):
+        return f"<LabelTable: {len(self)} labels>"
+
+    def add(self, label: str) -> int:
+        """Return the id of label, adding it to the table if missing."""
+        taxon_id = self._ids.get(label)
+        if taxon_id is None:
+            # only new labels take the lock, so that readers running in
+            # worker threads can share a table
+            with self._lock:
+                taxon_id = self._ids.get(label)
+                if taxon_id is None:
+                    self._labels.append(label)
+                    taxon_id = self._ids[label] = len(self._labels) - 1
+        return taxon_id
+
+    def intern(self, label: str) -> str:
+        """Return the shared string object equal to label."""
+        return self._labels[self.add(label)]